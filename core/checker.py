@@ -61,6 +61,7 @@ def check_entry(entry, callback, runner=default_runner):
             return result
 
         result["output"] = ""
+        output_texts = []
 
         def wrapped_callback(event_type, data):
             if event_type == "output":
@@ -69,7 +70,7 @@ def check_entry(entry, callback, runner=default_runner):
                     typ = part["type"]
                     if typ == "input":
                         continue
-                    result["output"] += part["text"]
+                    output_texts.append(part["text"])
                     parts.append(part)
                 data["parts"] = parts
             return callback(event_type, data)
@@ -87,6 +88,7 @@ def check_entry(entry, callback, runner=default_runner):
             runner.run(entry["input"], mode)
         finally:
             result["birdseye_objects"] = runner.birdseye_objects
+            result["output"] = "".join(output_texts)
 
         if runner.question_wizard:
             (
@@ -8,11 +8,9 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from functools import cached_property, cache
 from importlib import import_module
-from io import StringIO
 from pathlib import Path
 from random import shuffle
 from textwrap import indent
-from tokenize import Untokenizer, generate_tokens
 from types import MethodType
 from typing import Union, List, get_type_hints
 
@@ -109,6 +107,11 @@ def basic_signature(func):
     return f'({joined})'
 
 
+@cache
+def cached_type_hints(func):
+    return get_type_hints(func)
+
+
 def basic_function_header(func):
     return highlighted_markdown(f"    def {func.__name__}{basic_signature(func)}:")
 
@@ -269,12 +272,8 @@ def get_solution(step):
     program = step.show_solution_program
     tokens = split_into_tokens(program)
 
-    masked_indices = []
-    mask = [False] * len(tokens)
-    for i, token in enumerate(tokens):
-        if not token.isspace():
-            masked_indices.append(i)
-            mask[i] = True
+    mask = [not token.isspace() for token in tokens]
+    masked_indices = [i for i, masked in enumerate(mask) if masked]
     shuffle(masked_indices)
 
     if step.parsons_solution:
@@ -302,6 +301,7 @@ def get_solution(step):
 
 pages = {}
 page_slugs_list = []
+pages_list = []
 
 
 class PageMeta(type):
@@ -312,8 +312,10 @@ class PageMeta(type):
         super().__init__(*args, **kwargs)
         if cls.__name__ == "Page":
             return
+        cls._index = len(page_slugs_list)
         pages[cls.slug] = cls
         page_slugs_list.append(cls.slug)
+        pages_list.append(cls)
         cls.step_names = []
         for key, value in cls.__dict__.items():
             if getattr(value, "is_step", False):
@@ -364,15 +366,15 @@ class PageMeta(type):
 
     @property
     def index(self):
-        return page_slugs_list.index(self.slug)
+        return self._index
 
     @property
     def next_page(self):
-        return pages[page_slugs_list[self.index + 1]]
+        return pages_list[self.index + 1]
 
     @property
     def previous_page(self):
-        return pages[page_slugs_list[self.index - 1]]
+        return pages_list[self.index - 1]
 
     @property
     def steps(self):
@@ -728,7 +730,7 @@ class ExerciseStep(Step):
     def generate_inputs(cls):
         return {
             name: generate_for_type(typ)
-            for name, typ in get_type_hints(cls.solution).items()
+            for name, typ in cached_type_hints(cls.solution).items()
         }
 
 
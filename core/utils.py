@@ -164,6 +164,9 @@ def format_exception_string():
 
 
 def highlighted_markdown_and_codes(text):
+    if not text:
+        return "", []
+
     from markdown import markdown
     from .markdown_extensions import HighlightPythonExtension
 
@@ -172,6 +175,7 @@ def highlighted_markdown_and_codes(text):
     return markdown(text, extensions=[extension, 'markdown.extensions.tables']), extension.codes
 
 
+@functools.lru_cache(maxsize=1024)
 def highlighted_markdown(text):
     result = highlighted_markdown_and_codes(text)[0]
     if "__copyable__" in result or "__no_auto_translate__" in result:
@@ -327,13 +331,12 @@ def split_into_tokens_gen(s):
     except SyntaxError:
         yield from s
         return
-    for t1, t2 in zip(tokens, tokens[1:]):
-        start1, end1 = token_text_range(t1, linenos)
-        start2, end2 = token_text_range(t2, linenos)
+    ranges = [token_text_range(token, linenos) for token in tokens]
+    for (start1, end1), (start2, end2) in zip(ranges, ranges[1:]):
         assert start1 <= end1 <= start2 <= end2
         yield s[start1:end1]
         yield s[end1:start2]
-    start, end = token_text_range(tokens[-1], linenos)
+    start, end = ranges[-1]
     yield s[start:end]
     yield s[end:]
 